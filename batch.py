@@ -0,0 +1,245 @@
+"""Run graph, covariance, encoding and normalization jobs over input files.
+
+Usage: python batch.py jobs.json --output results.jsonl
+
+The jobs file is a JSON list (or one JSON object per line) such as
+
+    [{"kind": "graph", "input": "edges.csv", "metrics": ["betweenness", "pagerank"]},
+     {"kind": "covariance", "input": "table.csv", "skip_header": true},
+     {"kind": "encoding", "input": "colors.tsv"},
+     {"kind": "normalization", "input": "table.csv", "skip_header": true}]
+
+Relative input paths are resolved against the jobs file. Each job prints one
+strict JSON object per line (non-finite numbers become null). Graph jobs run
+every metric separately, recording failures under "errors", and by default
+skip the undirected-only metrics on directed graphs. Results are cached under
+--cache-dir keyed by the sha256 of the input bytes and the job parameters, so
+re-running a job on an unchanged file (wherever it now lives) reads the stored
+answer back.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from hw1 import array_statistics
+from hw2 import OneHotEncoder, StandardScaler
+from hw3 import default_delimiter, load_edge_list
+
+CACHE_VERSION = 2  # bump when a job's output changes for the same input
+
+GRAPH_METRICS = {
+    'closeness': lambda g: g.closeness_centrality(),
+    'eccentricity': lambda g: g.eccentricities(),
+    'betweenness': lambda g: g.betweenness_centrality(normalized=True),
+    'average_path_length': lambda g: g.average_shortest_path_length(),
+    'clustering': lambda g: g.average_clustering_coefficient(),
+    'triangles': lambda g: g.triangle_counts(),
+    'transitivity': lambda g: g.transitivity(),
+    'pagerank': lambda g: g.pagerank(),
+    'eigenvector': lambda g: g.eigenvector_centrality(),
+    'components': lambda g: g.connected_components(),
+    'component_measures': lambda g: g.component_distance_measures(),
+    'radius_and_diameter': lambda g: g.radius_and_diameter(),
+    'degree_histogram': lambda g: g.degree_histogram(),
+}
+UNDIRECTED_ONLY = {'triangles', 'transitivity', 'component_measures', 'radius_and_diameter'}
+
+
+def read_rows(path, delimiter=None, skip_header=False, comments='#'):
+    """Split a (possibly gzipped) text table into lists of stripped fields"""
+    if delimiter is None:
+        delimiter = default_delimiter(path)
+    opener = gzip.open if path.endswith('.gz') else open
+    rows = []
+    with opener(path, 'rt') as f:
+        if skip_header:
+            next(f, None)
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith(comments):
+                continue
+            rows.append([field.strip() for field in line.split(delimiter)])
+    return rows
+
+
+def _numeric_table(job):
+    return np.array(read_rows(job['input'], job.get('delimiter'), job.get('skip_header', False)),
+                    dtype=float)
+
+
+def run_graph(job):
+    """Every requested metric, each run on its own so one failure keeps the rest"""
+    directed = job.get('directed', False)
+    metrics = job.get('metrics')
+    if metrics is None:
+        metrics = [m for m in GRAPH_METRICS if not (directed and m in UNDIRECTED_ONLY)]
+    unknown = set(metrics) - set(GRAPH_METRICS)
+    if unknown:
+        raise ValueError(f"unknown graph metrics {sorted(unknown)}")
+    g = load_edge_list(job['input'], delimiter=job.get('delimiter'), directed=directed,
+                       skip_header=job.get('skip_header', False))
+    results, errors = {}, {}
+    for metric in metrics:
+        try:
+            results[metric] = GRAPH_METRICS[metric](g)
+        except Exception as error:  # e.g. scipy missing for pagerank
+            errors[metric] = f"{type(error).__name__}: {error}"
+    return {'metrics': results, 'errors': errors}
+
+
+def run_covariance(job):
+    return array_statistics(_numeric_table(job))
+
+
+def run_encoding(job):
+    rows = read_rows(job['input'], job.get('delimiter'), job.get('skip_header', False))
+    encoder = OneHotEncoder().fit(rows)
+    return {
+        'categories': [sorted(mapping, key=mapping.get) for mapping in encoder.categories],
+        'encoded': encoder.transform(rows),
+    }
+
+
+def run_normalization(job):
+    data = _numeric_table(job)
+    scaler = StandardScaler().fit(data)
+    return {'mean': scaler.mean, 'std': scaler.std, 'normalized': scaler.transform(data)}
+
+
+JOBS = {
+    'graph': run_graph,
+    'covariance': run_covariance,
+    'encoding': run_encoding,
+    'normalization': run_normalization,
+}
+
+
+def to_json(value):
+    """Convert numpy arrays and scalars, sets and tuples into plain JSON values
+
+    inf and nan (eccentricities across components, correlations of constant
+    columns) have no JSON spelling, so they become null.
+    """
+    if isinstance(value, dict):
+        return {str(k): to_json(v) for k, v in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(to_json(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return [to_json(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return to_json(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def cache_key(job):
+    """sha256 of the input file's bytes plus every job parameter except its path"""
+    digest = hashlib.sha256()
+    with open(job['input'], 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    params = {k: v for k, v in job.items() if k != 'input'}
+    digest.update(json.dumps([CACHE_VERSION, params], sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def check_job(job):
+    """Raise ValueError unless job is an object with a known kind and an input path"""
+    if not isinstance(job, dict):
+        raise ValueError(f"expected a JSON object, got {type(job).__name__}")
+    if job.get('kind') not in JOBS:
+        raise ValueError(f"unknown job kind {job.get('kind')!r}; expected one of {sorted(JOBS)}")
+    if not isinstance(job.get('input'), str):
+        raise ValueError("missing 'input' path")
+
+
+def run_job(job, cache_dir=None):
+    """Return (result, key, cached) for one job, consulting cache_dir if given"""
+    check_job(job)
+    key = cache_key(job)
+    path = os.path.join(cache_dir, key[:2], key + '.json') if cache_dir else None
+    if path and os.path.exists(path):
+        with open(path) as f:
+            return json.load(f), key, True
+    result = to_json(JOBS[job['kind']](job))
+    if path:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        partial = f"{path}.{os.getpid()}.tmp"
+        with open(partial, 'w') as f:
+            json.dump(result, f, allow_nan=False)
+        os.replace(partial, path)  # readers never see a half-written entry
+    return result, key, False
+
+
+def load_jobs(path):
+    """Jobs from a JSON list or JSON lines file, inputs made relative to it
+
+    Every job is checked up front, so a malformed entry is reported before
+    any of the (possibly long) jobs ahead of it run.
+    """
+    with open(path) as f:
+        text = f.read()
+    stripped = text.lstrip()
+    if stripped.startswith('['):
+        jobs = json.loads(stripped)
+    else:
+        jobs = [json.loads(line) for line in text.splitlines() if line.strip()]
+    if not isinstance(jobs, list):
+        raise ValueError(f"{path}: expected a JSON list of jobs")
+    base = os.path.dirname(os.path.abspath(path))
+    for index, job in enumerate(jobs):
+        try:
+            check_job(job)
+        except ValueError as error:
+            raise ValueError(f"{path}: job {index}: {error}") from None
+        job['input'] = os.path.join(base, os.path.expanduser(job['input']))
+    return jobs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('jobs', help='JSON list or JSON lines file of jobs')
+    parser.add_argument('--cache-dir', default='.batch_cache')
+    parser.add_argument('--no-cache', action='store_true', help='always recompute')
+    parser.add_argument('--output', help='write JSON lines here instead of stdout')
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load_jobs(args.jobs)
+    except (OSError, ValueError) as error:
+        parser.exit(2, f"{parser.prog}: error: {error}\n")
+    cache_dir = None if args.no_cache else args.cache_dir
+    out = open(args.output, 'w') if args.output else sys.stdout
+    failures = 0
+    try:
+        for index, job in enumerate(jobs):
+            record = {'job': index, 'kind': job.get('kind'), 'input': job['input']}
+            start = time.perf_counter()
+            try:
+                record['result'], record['key'], record['cached'] = run_job(job, cache_dir)
+            except Exception as error:  # recorded, and the remaining jobs still run
+                record['error'] = f"{type(error).__name__}: {error}"
+            else:
+                if isinstance(record['result'], dict) and record['result'].get('errors'):
+                    record['error'] = 'some metrics failed, see result.errors'
+            failures += 'error' in record
+            record['seconds'] = time.perf_counter() - start
+            print(json.dumps(record, allow_nan=False), file=out, flush=True)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,3 +1,7 @@
+import numpy as np
+
+import instrument
+
 def sample_mean(data):
     """Calculate the sample mean of a list of numbers."""
     return sum(data) / len(data)
@@ -18,6 +22,7 @@ def multivariate_sample_mean(*data_sets):
     means = [sample_mean(data) for data in data_sets]
     return means
 
+@instrument.timed
 def covariance_matrix(*data_sets):
     """Calculate the covariance matrix for multiple lists of numbers."""
     n = len(data_sets)
@@ -42,35 +47,94 @@ def total_variance(cov_matrix):
     """Calculate the total variance from a covariance matrix."""
     return sum(cov_matrix[i][i] for i in range(len(cov_matrix)))
 
-X1 = [0.3, 0.4, 1.8, 6, -0.5, 0.4, 1.1]
-X2 = [23, 1, 4, 50, 34, 19, 11]
-X3 = [5.6, 5.2, 5.2, 5.1, 5.7, 5.4, 5.5]
-
-mean = sample_mean(X3)
-print("Sample Mean: " + str(mean))
-
-cov = sample_covariance(X1, X3)
-print("Sample Covariance: " + str(cov))
-
-multivariate_mean = multivariate_sample_mean(X1, X2, X3)
-print("Multivariate Sample Mean: " + str(multivariate_mean))
-
-variance = sample_variance(X2)
-print("Sample Variance of (sigma Hat Squared): " + str(variance))
-
-cov_mat = covariance_matrix(X1, X2, X3)
-print("Covariance matrix : " + str(cov_mat))
-
-corr = correlation(X1, X3)
-print("Correlation between X1 and X3: " + str(corr))
-
-total_var = total_variance(cov_mat)
-print("Total Variance: " + str(total_var))
-
-
-print("\n\n\n")
-
-'''Question 3 code now'''
+def as_data_matrix(*data_sets):
+    """Stack lists of numbers (or one 2-D array) into an observations x variables array."""
+    if len(data_sets) == 1 and np.ndim(data_sets[0]) == 2:
+        return np.asarray(data_sets[0], dtype=float)
+    return np.column_stack([np.asarray(data, dtype=float) for data in data_sets])
+
+@instrument.timed
+def array_statistics(*data_sets, block_size=65536):
+    """Calculate the means, covariance matrix, correlation matrix and total variance at once.
+
+    Takes the same lists as covariance_matrix or a single 2-D array with one
+    column per variable. The covariance comes from centered matrix products
+    accumulated over row blocks, so no full centered copy is made.
+    """
+    X = as_data_matrix(*data_sets)
+    means = X.mean(axis=0)
+    scatter = np.zeros((X.shape[1], X.shape[1]))
+    for start in range(0, len(X), block_size):
+        centered = X[start:start + block_size] - means
+        scatter += centered.T @ centered
+    cov_matrix = scatter / (len(X) - 1)
+    std_devs = np.sqrt(np.diag(cov_matrix))
+    return {
+        "mean": means,
+        "covariance": cov_matrix,
+        "correlation": cov_matrix / np.outer(std_devs, std_devs),
+        "total_variance": np.trace(cov_matrix),
+    }
+
+class RunningStatistics(object):
+    """Single-pass accumulator for means, variances, covariance and correlation.
+
+    Feed it chunks with update() and combine accumulators from other workers
+    with merge(); both use Chan et al.'s pairwise update of the mean and
+    the co-moment matrix. A 1-D batch is a run of observations of a single
+    variable, a 2-D batch has one row per observation.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._mean = None
+        self._comoment = None
+
+    @instrument.timed
+    def update(self, batch):
+        """Fold a batch of observations into the running totals."""
+        batch = np.asarray(batch, dtype=float)
+        if batch.ndim == 1:
+            batch = batch[:, None]
+        if len(batch):
+            mean = batch.mean(axis=0)
+            centered = batch - mean
+            self._combine(len(batch), mean, centered.T @ centered)
+        return self
+
+    @instrument.timed
+    def merge(self, other):
+        """Fold the totals of another accumulator into this one."""
+        if other.count:
+            self._combine(other.count, other._mean, other._comoment)
+        return self
+
+    def _combine(self, count, mean, comoment):
+        if not self.count:
+            self.count, self._mean, self._comoment = count, mean.copy(), comoment.copy()
+            return
+        total = self.count + count
+        delta = mean - self._mean
+        self._comoment = self._comoment + comoment + np.outer(delta, delta) * (self.count * count / total)
+        self._mean = self._mean + delta * (count / total)
+        self.count = total
+
+    @instrument.timed
+    def result(self):
+        """Return the statistics in the same layout as array_statistics."""
+        cov_matrix = self._comoment / (self.count - 1)
+        std_devs = np.sqrt(np.diag(cov_matrix))
+        return {
+            "count": self.count,
+            "mean": self._mean.copy(),
+            "variance": np.diag(cov_matrix).copy(),
+            "covariance": cov_matrix,
+            "correlation": cov_matrix / np.outer(std_devs, std_devs),
+            "total_variance": np.trace(cov_matrix),
+        }
+
+
+# Question 3
 
 def l2_norm(vector):
     """Calculate the L2 norm (Euclidean distance) of a vector."""
@@ -87,17 +151,48 @@ def cosine_of_angle(a, b):
     norm_b = l2_norm(b)
     return dot_product / (norm_a * norm_b)
 
-a = (2, 5, -2.6, 6)
-b = (15, 2.5, 4, 4)
 
-# Calculate the L2 norm of the difference between vectors a and b
-l2_norm_diff = l2_norm([ai - bi for ai, bi in zip(a, b)])
-print("L2 Norm of the difference: " + str(l2_norm_diff))
+if __name__ == '__main__':
+    X1 = [0.3, 0.4, 1.8, 6, -0.5, 0.4, 1.1]
+    X2 = [23, 1, 4, 50, 34, 19, 11]
+    X3 = [5.6, 5.2, 5.2, 5.1, 5.7, 5.4, 5.5]
+
+    mean = sample_mean(X3)
+    print("Sample Mean: " + str(mean))
+
+    cov = sample_covariance(X1, X3)
+    print("Sample Covariance: " + str(cov))
+
+    multivariate_mean = multivariate_sample_mean(X1, X2, X3)
+    print("Multivariate Sample Mean: " + str(multivariate_mean))
+
+    variance = sample_variance(X2)
+    print("Sample Variance of (sigma Hat Squared): " + str(variance))
+
+    cov_mat = covariance_matrix(X1, X2, X3)
+    print("Covariance matrix : " + str(cov_mat))
+
+    corr = correlation(X1, X3)
+    print("Correlation between X1 and X3: " + str(corr))
+
+    total_var = total_variance(cov_mat)
+    print("Total Variance: " + str(total_var))
+
+
+    print("\n\n\n")
+
+    # Question 3
+    a = (2, 5, -2.6, 6)
+    b = (15, 2.5, 4, 4)
+
+    # Calculate the L2 norm of the difference between vectors a and b
+    l2_norm_diff = l2_norm([ai - bi for ai, bi in zip(a, b)])
+    print("L2 Norm of the difference: " + str(l2_norm_diff))
 
-# Calculate the L1 norm of the difference between vectors a and b
-l1_norm_diff = l1_norm([ai - bi for ai, bi in zip(a, b)])
-print("L1 Norm of the difference: " + str(l1_norm_diff))
+    # Calculate the L1 norm of the difference between vectors a and b
+    l1_norm_diff = l1_norm([ai - bi for ai, bi in zip(a, b)])
+    print("L1 Norm of the difference: " + str(l1_norm_diff))
 
-# Calculate the cosine of the angle between vectors a and b
-cosine_angle = cosine_of_angle(a, b)
-print("Cosine of the angle: " + str(cosine_angle))
\ No newline at end of file
+    # Calculate the cosine of the angle between vectors a and b
+    cosine_angle = cosine_of_angle(a, b)
+    print("Cosine of the angle: " + str(cosine_angle))
@@ -1,19 +1,78 @@
+import pickle
+
+import numpy as np
+
+import instrument
+
+
+class OneHotEncoder(object):
+    """One-hot encoder for any number of categorical columns.
+
+    fit() learns the sorted vocabulary of every column in a single pass over
+    the rows; transform() then reuses it, so new data is encoded against the
+    same columns without re-deriving the categories.
+    """
+
+    def __init__(self):
+        self.categories = None
+        self.offsets = None
+
+    @instrument.timed
+    def fit(self, data):
+        """Learn the categories of each column from an iterable of rows."""
+        seen = None
+        for row in data:
+            if seen is None:
+                seen = [set() for _ in row]
+            for values, value in zip(seen, row):
+                values.add(value)
+        self.categories = [{v: i for i, v in enumerate(sorted(values))} for values in seen or []]
+        self.offsets = np.cumsum([0] + [len(c) for c in self.categories])
+        return self
+
+    @property
+    def n_features(self):
+        return int(self.offsets[-1])
+
+    def transform_indices(self, data):
+        """Encode rows as an (n_rows, n_columns) array of active one-hot column indices."""
+        try:
+            codes = [[mapping[value] for mapping, value in zip(self.categories, row)] for row in data]
+        except KeyError as error:
+            raise ValueError(f"unknown category {error.args[0]!r}; refit the encoder") from None
+        codes = np.array(codes, dtype=np.int64).reshape(-1, len(self.categories))
+        return codes + self.offsets[:-1]
+
+    @instrument.timed
+    def transform(self, data, sparse=False):
+        """Encode rows as a dense 0/1 array, or a SciPy CSR matrix if sparse=True."""
+        indices = self.transform_indices(data)
+        n_rows, n_columns = indices.shape
+        if sparse:
+            from scipy.sparse import csr_matrix
+            indptr = np.arange(0, n_rows * n_columns + 1, n_columns)
+            return csr_matrix((np.ones(indices.size, dtype=np.int8), indices.ravel(), indptr),
+                              shape=(n_rows, self.n_features))
+        encoded = np.zeros((n_rows, self.n_features), dtype=np.int8)
+        encoded[np.arange(n_rows)[:, None], indices] = 1
+        return encoded
+
+    def transform_chunks(self, data, chunk_size=65536, sparse=True):
+        """Yield encoded blocks of at most chunk_size rows from any iterable of rows."""
+        chunk = []
+        for row in data:
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield self.transform(chunk, sparse=sparse)
+                chunk = []
+        if chunk:
+            yield self.transform(chunk, sparse=sparse)
+
+
+@instrument.timed
 def one_hot_encoding(data):
     """Transform categorical attributes in data to one-hot encoding."""
-    # Create unique value mapping for each attribute
-    colors = {v: i for i, v in enumerate(sorted(set(row[0] for row in data)))}      #for future hw where I might use this, future me you probally only need to adjust/modify these three lines maybe change their names
-    yes_no = {v: i for i, v in enumerate(sorted(set(row[1] for row in data)))}
-    directions = {v: i for i, v in enumerate(sorted(set(row[2] for row in data)))}
-
-    # Encode data
-    transformed_data = []
-    for row in data:
-        encoded_row = [0] * (len(colors) + len(yes_no) + len(directions))
-        encoded_row[colors[row[0]]] = 1
-        encoded_row[len(colors) + yes_no[row[1]]] = 1
-        encoded_row[len(colors) + len(yes_no) + directions[row[2]]] = 1
-        transformed_data.append(encoded_row)
-    return transformed_data
+    return OneHotEncoder().fit(data).transform(data).tolist()
 
 def euclidean_distance(row1, row2):
     """Calculate the Euclidean distance between two data rows."""
@@ -35,6 +94,241 @@ def jaccard_coefficient(row1, row2):
     union = sum(a == 1 or b == 1 for a, b in zip(row1, row2))
     return intersection / union
 
+PAIRWISE_METRICS = ("euclidean", "manhattan", "cosine", "hamming", "jaccard")
+
+
+def _is_binary(X):
+    return bool(np.all((X == 0) | (X == 1)))
+
+
+_BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(words):
+    """Number of set bits in each row of uint64 words (summed over the last axis)."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    counts = _BYTE_POPCOUNT[words.view(np.uint8)]
+    return counts.sum(axis=-1, dtype=np.int64)
+
+
+def pack_rows(X):
+    """Pack 0/1 rows into uint64 words, 64 features per word (one row per packed row)."""
+    bits = np.packbits(np.atleast_2d(np.asarray(X)) == 1, axis=1)
+    padding = -bits.shape[1] % 8
+    if padding:
+        bits = np.pad(bits, ((0, 0), (0, padding)))
+    return np.ascontiguousarray(bits).view(np.uint64)
+
+
+def packed_hamming_distance(row1, row2):
+    """Hamming distance between packed rows; broadcasts over leading axes."""
+    return _popcount(row1 ^ row2)
+
+
+def packed_jaccard_coefficient(row1, row2):
+    """Jaccard coefficient between packed rows; broadcasts over leading axes."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _popcount(row1 & row2) / _popcount(row1 | row2)
+
+
+def pairwise_blocks(X, Y=None, metric="euclidean", block_size=1024):
+    """Yield (row, col, block) tiles of metric between the rows of X and Y.
+
+    Each block covers at most block_size x block_size pairs, so arbitrarily
+    large comparisons run in bounded memory. Euclidean and cosine use the
+    Gram matrix X @ Y.T; Hamming (on 0/1 rows) and Jaccard pack the rows
+    into bitsets and count bits of XOR / AND / OR a word at a time.
+    """
+    if metric not in PAIRWISE_METRICS:
+        raise ValueError(f"unknown metric {metric!r}, expected one of {PAIRWISE_METRICS}")
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    Y = X if Y is None else np.atleast_2d(np.asarray(Y, dtype=float))
+    x_sq = y_sq = None
+    if metric in ("euclidean", "cosine"):
+        x_sq, y_sq = (X * X).sum(axis=1), (Y * Y).sum(axis=1)
+    if metric == "jaccard" or (metric == "hamming" and _is_binary(X) and _is_binary(Y)):
+        X, Y = pack_rows(X), pack_rows(Y)
+
+    for i in range(0, len(X), block_size):
+        xs = None if x_sq is None else x_sq[i:i + block_size]
+        for j in range(0, len(Y), block_size):
+            ys = None if y_sq is None else y_sq[j:j + block_size]
+            yield i, j, _pairwise_block(metric, X[i:i + block_size], Y[j:j + block_size], xs, ys)
+
+
+def _pairwise_block(metric, Xb, Yb, xs=None, ys=None):
+    """metric between two tiles of rows.
+
+    xs and ys are the rows' squared norms, needed by euclidean and cosine;
+    uint64 tiles are packed bitsets (pack_rows) for hamming and jaccard.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if metric == "euclidean":
+            return np.sqrt(np.maximum(xs[:, None] + ys[None, :] - 2 * (Xb @ Yb.T), 0))
+        if metric == "cosine":
+            return (Xb @ Yb.T) / np.sqrt(xs[:, None] * ys[None, :])
+    if Xb.dtype == np.uint64:
+        kernel = packed_jaccard_coefficient if metric == "jaccard" else packed_hamming_distance
+        return kernel(Xb[:, None, :], Yb[None, :, :])
+    # One feature at a time keeps the temporary at block size
+    block = np.zeros((len(Xb), len(Yb)))
+    for k in range(Xb.shape[1]):
+        column = Xb[:, k, None] - Yb[None, :, k]
+        block += np.abs(column) if metric == "manhattan" else (column != 0)
+    return block
+
+
+@instrument.timed
+def pairwise(X, Y=None, metric="euclidean", block_size=1024):
+    """Calculate the full matrix of metric between every row of X and every row of Y."""
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    n_rows = len(X) if Y is None else len(np.atleast_2d(Y))
+    result = np.empty((len(X), n_rows))
+    for i, j, block in pairwise_blocks(X, Y, metric, block_size):
+        result[i:i + block.shape[0], j:j + block.shape[1]] = block
+    return result
+
+
+SIMILARITY_METRICS = ("cosine", "jaccard")  # larger means nearer
+
+
+class NearestNeighbors(object):
+    """k-nearest-neighbour index over encoded or normalized rows.
+
+    fit() prepares the rows once for the index metric: a SciPy KD-tree for
+    euclidean/manhattan data with at most tree_max_dims columns, squared row
+    norms for euclidean, unit-length rows for cosine and packed bitsets for
+    jaccard or 0/1 hamming. Other metrics passed to query() get theirs built
+    on first use. Scans compare block_size queries with block_size indexed
+    rows at a time, so memory stays bounded on both sides.
+    """
+
+    def __init__(self, metric="euclidean", tree_max_dims=16, leaf_size=40, block_size=1024):
+        if metric not in PAIRWISE_METRICS:
+            raise ValueError(f"unknown metric {metric!r}, expected one of {PAIRWISE_METRICS}")
+        self.metric = metric
+        self.tree_max_dims = tree_max_dims
+        self.leaf_size = leaf_size
+        self.block_size = block_size
+
+    @instrument.timed
+    def fit(self, data):
+        """Build the index over the rows of data."""
+        self.data = np.atleast_2d(np.asarray(data, dtype=float))
+        self._tree = None
+        if self.metric in ("euclidean", "manhattan") and self.data.shape[1] <= self.tree_max_dims:
+            try:
+                from scipy.spatial import cKDTree
+            except ImportError:
+                pass  # the blocked scan gives the same answers, just slower
+            else:
+                self._tree = cKDTree(self.data, leafsize=self.leaf_size)
+        self._binary = _is_binary(self.data)
+        self._prepared = {}
+        if self._tree is None:
+            kind = self._kind(self.metric)
+            if kind is not None:
+                self._rows(kind)
+        return self
+
+    def _kind(self, metric, binary_queries=True):
+        """Which preparation of the indexed rows metric scans, if any."""
+        if metric == "euclidean":
+            return "sq_norms"
+        if metric == "cosine":
+            return "unit"
+        if metric == "jaccard" or (metric == "hamming" and self._binary and binary_queries):
+            return "packed"
+        return None
+
+    def _rows(self, kind):
+        """The indexed rows prepared as kind, built once and kept."""
+        if kind not in self._prepared:
+            if kind == "sq_norms":
+                rows = (self.data * self.data).sum(axis=1)
+            elif kind == "unit":
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    rows = self.data / np.sqrt((self.data * self.data).sum(axis=1, keepdims=True))
+            else:
+                rows = pack_rows(self.data)
+            self._prepared[kind] = rows
+        return self._prepared[kind]
+
+    def _blocks(self, queries, metric):
+        """Yield (column offset, block) of metric between queries and each tile of indexed rows."""
+        kind = self._kind(metric, metric != "hamming" or _is_binary(queries))
+        q_sq = None
+        if kind == "sq_norms":
+            q_sq = (queries * queries).sum(axis=1)
+        elif kind == "unit":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                queries = queries / np.sqrt((queries * queries).sum(axis=1, keepdims=True))
+        elif kind == "packed":
+            queries = pack_rows(queries)
+        rows = self.data if kind in (None, "sq_norms") else self._rows(kind)
+        step = self.block_size
+        for j in range(0, len(self.data), step):
+            if kind == "unit":
+                yield j, queries @ rows[j:j + step].T
+            else:
+                norms = None if q_sq is None else self._rows("sq_norms")[j:j + step]
+                yield j, _pairwise_block(metric, queries, rows[j:j + step], q_sq, norms)
+
+    @instrument.timed
+    def query(self, X, k=1, metric=None):
+        """Return (values, indices) of the k nearest indexed rows for each row of X.
+
+        values are distances in increasing order, or similarities in
+        decreasing order for cosine and jaccard.
+        """
+        metric = metric or self.metric
+        if metric not in PAIRWISE_METRICS:
+            raise ValueError(f"unknown metric {metric!r}, expected one of {PAIRWISE_METRICS}")
+        queries = np.atleast_2d(np.asarray(X, dtype=float))
+        k = min(k, len(self.data))
+        if self._tree is not None and metric == self.metric:
+            values, indices = self._tree.query(queries, k=k, p=2 if metric == "euclidean" else 1)
+            return values.reshape(len(queries), k), indices.reshape(len(queries), k)
+
+        sign = -1 if metric in SIMILARITY_METRICS else 1
+        values = np.empty((len(queries), k))
+        indices = np.empty((len(queries), k), dtype=np.int64)
+        for i in range(0, len(queries), self.block_size):
+            tile = slice(i, i + self.block_size)
+            values[tile], indices[tile] = self._search(queries[tile], k, metric, sign)
+        return sign * values, indices
+
+    def _search(self, queries, k, metric, sign):
+        """Best k (signed scores, indices) for one tile of queries, in order."""
+        best = np.full((len(queries), k), np.inf)
+        best_index = np.zeros((len(queries), k), dtype=np.int64)
+        for j, block in self._blocks(queries, metric):
+            scores = sign * block
+            if sign < 0:
+                # nan (zero rows for cosine/jaccard) sorts after every real candidate
+                scores = np.nan_to_num(scores, nan=np.inf, copy=False)
+            scores = np.concatenate([best, scores], axis=1)
+            columns = np.concatenate(
+                [best_index, np.broadcast_to(np.arange(j, j + block.shape[1]), block.shape)], axis=1)
+            keep = np.argpartition(scores, k - 1, axis=1)[:, :k]
+            best = np.take_along_axis(scores, keep, axis=1)
+            best_index = np.take_along_axis(columns, keep, axis=1)
+        order = np.argsort(best, axis=1, kind="stable")
+        return np.take_along_axis(best, order, axis=1), np.take_along_axis(best_index, order, axis=1)
+
+    def save(self, path):
+        """Persist the built index (tree included) to path."""
+        with open(path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """Load an index written by save()."""
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
 def multivariate_mean(data):
     """Calculate the multivariate mean of a dataset."""
     return [sum(col) / len(data) for col in zip(*data)]
@@ -44,15 +338,71 @@ def sample_variance(column):
     mean = sum(column) / len(column)
     return sum((x - mean) ** 2 for x in column) / (len(column) - 1)
 
+class StandardScaler(object):
+    """Z-score scaler that learns column means and standard deviations once.
+
+    fit() or repeated partial_fit() calls on chunks learn the parameters
+    (sample standard deviation, as in sample_variance); transform() applies
+    them to new data, writing into out= when given (pass the input itself to
+    normalize in place). Columns with zero deviation map to 0, like
+    z_score_normalization always has.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = None
+        self._squares = None  # per-column sum of squared deviations
+
+    @instrument.timed
+    def fit(self, data):
+        """Learn the parameters from data, discarding anything learned before."""
+        self.__init__()
+        return self.partial_fit(data)
+
+    @instrument.timed
+    def partial_fit(self, chunk):
+        """Fold a chunk of rows into the parameters (Chan et al. pairwise update)."""
+        chunk = np.atleast_2d(np.asarray(chunk, dtype=float))
+        if not len(chunk):
+            return self
+        mean = chunk.mean(axis=0)
+        squares = ((chunk - mean) ** 2).sum(axis=0)
+        if not self.count:
+            self.count, self.mean, self._squares = len(chunk), mean, squares
+            return self
+        total = self.count + len(chunk)
+        delta = mean - self.mean
+        self._squares = self._squares + squares + delta ** 2 * (self.count * len(chunk) / total)
+        self.mean = self.mean + delta * (len(chunk) / total)
+        self.count = total
+        return self
+
+    @property
+    def std(self):
+        return np.sqrt(self._squares / (self.count - 1))
+
+    @instrument.timed
+    def transform(self, data, out=None):
+        """Z-score normalize data with the fitted parameters."""
+        data = np.asarray(data, dtype=float)
+        std = self.std
+        out = np.subtract(data, self.mean, out=out)
+        np.divide(out, np.where(std > 0, std, 1), out=out)
+        out[..., std == 0] = 0
+        return out
+
+    @instrument.timed
+    def inverse_transform(self, data, out=None):
+        """Map normalized data back to the original units."""
+        data = np.asarray(data, dtype=float)
+        out = np.multiply(data, self.std, out=out)
+        return np.add(out, self.mean, out=out)
+
+
+@instrument.timed
 def z_score_normalization(data):
     """Normalize dataset using Z-score normalization."""
-    means = multivariate_mean(data)
-    std_devs = [sample_variance(col) ** 0.5 for col in zip(*data)]
-    normalized_data = []
-    for row in data:
-        normalized_row = [(val - mean) / std if std else 0 for val, mean, std in zip(row, means, std_devs)]
-        normalized_data.append(normalized_row)
-    return normalized_data
+    return StandardScaler().fit(data).transform(data).tolist()
 
 def print_rounded_array(arr, precision=3):
     """
@@ -71,60 +421,61 @@ def print_rounded_array(arr, precision=3):
     print("\n")
 
 
-# Define the data matrix from the PDF
-data = [
-    ("red", "yes", "North"),
-    ("blue", "no", "South"),
-    ("yellow", "no", "East"),
-    ("yellow", "no", "West"),
-    ("red", "yes", "North"),
-    ("yellow", "yes", "North"),
-    ("blue", "no", "West")
-]
+if __name__ == '__main__':
+    # Define the data matrix from the PDF
+    data = [
+        ("red", "yes", "North"),
+        ("blue", "no", "South"),
+        ("yellow", "no", "East"),
+        ("yellow", "no", "West"),
+        ("red", "yes", "North"),
+        ("yellow", "yes", "North"),
+        ("blue", "no", "West")
+    ]
 
-# Applying one-hot encoding to transform the data matrix
-matrix_y = one_hot_encoding(data)
-# print("Q1: One Hot Encoded Matrix Y: ", matrix_y, "\n")
-print("Q1: One Hot Encoded Matrix Y: ")
-print_rounded_array(matrix_y, 0)
+    # Applying one-hot encoding to transform the data matrix
+    matrix_y = one_hot_encoding(data)
+    # print("Q1: One Hot Encoded Matrix Y: ", matrix_y, "\n")
+    print("Q1: One Hot Encoded Matrix Y: ")
+    print_rounded_array(matrix_y, 0)
 
-# Calculate the Euclidean distance between x2 and x7 after one-hot encoding
-euclidean_distance_x2_x7 = euclidean_distance(matrix_y[1], matrix_y[6])
-print("Q2: Euclidean distance between x2 and x7: ", euclidean_distance_x2_x7, "\n")
+    # Calculate the Euclidean distance between x2 and x7 after one-hot encoding
+    euclidean_distance_x2_x7 = euclidean_distance(matrix_y[1], matrix_y[6])
+    print("Q2: Euclidean distance between x2 and x7: ", euclidean_distance_x2_x7, "\n")
 
-# Calculate the cosine similarity between x2 and x7 after one-hot encoding
-cosine_similarity_x2_x7 = cosine_similarity(matrix_y[1], matrix_y[6])
-print("Q3: cosine similarity between x2 and x7: ", cosine_similarity_x2_x7, "\n")
+    # Calculate the cosine similarity between x2 and x7 after one-hot encoding
+    cosine_similarity_x2_x7 = cosine_similarity(matrix_y[1], matrix_y[6])
+    print("Q3: cosine similarity between x2 and x7: ", cosine_similarity_x2_x7, "\n")
 
-# Calculate the Hamming distance between x2 and x7
-hamming_distance_x2_x7 = hamming_distance(matrix_y[1], matrix_y[6])
-print("Q4: Hamming distance between x2 and x7: ", hamming_distance_x2_x7, "\n")
+    # Calculate the Hamming distance between x2 and x7
+    hamming_distance_x2_x7 = hamming_distance(matrix_y[1], matrix_y[6])
+    print("Q4: Hamming distance between x2 and x7: ", hamming_distance_x2_x7, "\n")
 
-# Calculate the Jaccard coefficient between x2 and x7 after one-hot encoding
-jaccard_coefficient_x2_x7 = jaccard_coefficient(matrix_y[1], matrix_y[6])
-print("Q5: Jaccard coefficient between x2 and x7: ", jaccard_coefficient_x2_x7, "\n")
+    # Calculate the Jaccard coefficient between x2 and x7 after one-hot encoding
+    jaccard_coefficient_x2_x7 = jaccard_coefficient(matrix_y[1], matrix_y[6])
+    print("Q5: Jaccard coefficient between x2 and x7: ", jaccard_coefficient_x2_x7, "\n")
 
-# Calculate the multivariate mean of Y
-mean_Y = multivariate_mean(matrix_y)
-print("Q6: multivariate mean of Y: ", mean_Y, "\n")
+    # Calculate the multivariate mean of Y
+    mean_Y = multivariate_mean(matrix_y)
+    print("Q6: multivariate mean of Y: ", mean_Y, "\n")
 
-# Calculate the sample variance of the first column of Y
-variance_first_column_Y = sample_variance([row[0] for row in matrix_y])
-print("Q7: sample variance of the first column of Y: ", variance_first_column_Y, "\n")
+    # Calculate the sample variance of the first column of Y
+    variance_first_column_Y = sample_variance([row[0] for row in matrix_y])
+    print("Q7: sample variance of the first column of Y: ", variance_first_column_Y, "\n")
 
-# Apply Z-score normalization to Y
-Z = z_score_normalization(matrix_y)
-# print("Q8: Z-score normalization of Y: ", Z, "\n")
-print("Q8: Z-score normalization of Y:")
-print_rounded_array(Z)
+    # Apply Z-score normalization to Y
+    Z = z_score_normalization(matrix_y)
+    # print("Q8: Z-score normalization of Y: ", Z, "\n")
+    print("Q8: Z-score normalization of Y:")
+    print_rounded_array(Z)
 
-# Calculate the multivariate mean of Z
-mean_Z = multivariate_mean(Z)
-print("Q9: multivariate mean of Z: ", mean_Z, "\n")
+    # Calculate the multivariate mean of Z
+    mean_Z = multivariate_mean(Z)
+    print("Q9: multivariate mean of Z: ", mean_Z, "\n")
 
-# Calculate the Euclidean distance between z2 and z7
-euclidean_distance_z2_z7 = euclidean_distance(Z[1], Z[6])
-print("Q10: Euclidean distance between x2 and x7: ", euclidean_distance_z2_z7, "\n")
+    # Calculate the Euclidean distance between z2 and z7
+    euclidean_distance_z2_z7 = euclidean_distance(Z[1], Z[6])
+    print("Q10: Euclidean distance between x2 and x7: ", euclidean_distance_z2_z7, "\n")
 
 
 
@@ -133,6 +484,6 @@ print("Q10: Euclidean distance between x2 and x7: ", euclidean_distance_z2_z7, "
 
 
 
-# X1 = ["red", "blue", "yellow", "yellow", "red", "yellow", "blue"]
-# X2 = ["yes", "no", "no", "no", "yes", "yes", "no"]
-# X3 = ["North", "South", "East", "West", "North", "North", "West"]
\ No newline at end of file
+    # X1 = ["red", "blue", "yellow", "yellow", "red", "yellow", "blue"]
+    # X2 = ["yes", "no", "no", "no", "yes", "yes", "no"]
+    # X3 = ["North", "South", "East", "West", "North", "North", "West"]
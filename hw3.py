@@ -1,152 +1,730 @@
-from itertools import combinations
-from collections import Counter, defaultdict, deque
-from matplotlib import pyplot as plt
+from collections import OrderedDict, defaultdict, deque, namedtuple
+from collections.abc import Mapping
+import gzip
+import json
+import math
+import multiprocessing
+import os
+import random
+import time
+import numpy as np
+
+import instrument
+
+# Graph being sharded across a forked process pool; children inherit it
+# copy-on-write instead of receiving a pickled copy per task.
+_SHARED_GRAPH = None
+
+
+def _run_shard(task):
+    """Run one shard of a per-source metric on the graph shared by fork"""
+    method, sources = task
+    return getattr(_SHARED_GRAPH, method)(sources)
+
+
+# A sampled estimate: value +/- error holds with probability 1 - delta.
+# value and error are numbers, or dicts keyed by vertex.
+Estimate = namedtuple('Estimate', ['value', 'error', 'samples'])
+
+
+def _hoeffding(samples, delta):
+    """Half-width of a Hoeffding interval for the mean of samples in [0, 1]"""
+    return math.sqrt(math.log(2 / delta) / (2 * samples))
+
+
+def _keep_center_or_periphery(w, lower, upper, radius, diameter):
+    """Whether w's eccentricity bounds still allow it in the center or periphery"""
+    return lower[w] <= radius or upper[w] >= diameter
+
+
+def _keep_unsettled(w, lower, upper, radius, diameter):
+    """Whether w could still lower the radius or raise the diameter"""
+    return lower[w] < radius or upper[w] > diameter
+
+
+class UnionFind(object):
+    """ Disjoint sets of hashable items with path halving and union by size. """
+
+    def __init__(self, items=()):
+        self._parent = {}
+        self._size = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item):
+        if item not in self._parent:
+            self._parent[item] = item
+            self._size[item] = 1
+
+    def find(self, item):
+        """ Representative of item's set (item is added if unseen) """
+
+        self.add(item)
+        parent = self._parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, item1, item2):
+        root1, root2 = self.find(item1), self.find(item2)
+        if root1 == root2:
+            return root1
+        if self._size[root1] < self._size[root2]:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        self._size[root1] += self._size[root2]
+        return root1
+
+    def groups(self):
+        """ Every set, keyed by its representative """
+
+        groups = defaultdict(set)
+        for item in self._parent:
+            groups[self.find(item)].add(item)
+        return dict(groups)
 
 
 class Graph(object):
-    """ Graph data structure, undirected by default. """
+    """ Graph data structure, undirected by default.
+
+    With incremental=True the degree histogram, triangle counts, clustering
+    coefficients and connected components are updated on every add instead
+    of being recomputed, and only the cached BFS distances an insertion can
+    change are dropped.
+
+    eccentricity memoizes its BFS rows in an LRU cache holding at most
+    distance_cache_limit distances in total. find_shortest_path_length reads
+    a memoized row when there is one and otherwise runs a BFS that stops at
+    the goal; whole-graph sweeps run their BFS without storing it.
+    """
+
+    distance_cache_limit = 1000000
 
-    def __init__(self, connections, directed=False):
+    def __init__(self, connections, directed=False, incremental=False):
         self._graph = defaultdict(set)
         self._directed = directed
+        self._clear_caches()
+        # BFS scratch space reused by every query instead of copying paths
+        self._parent = {}
+        self._depth = {}
+        self._incremental = incremental
+        if incremental:
+            self._degree_counts = defaultdict(int)  # degree -> number of vertices
+            self._components = UnionFind()
+            if not directed:
+                self._triangles = {}
+                self._clustering_sum = 0.0
         self.add_connections(connections)
 
     def add_connections(self, connections):
         """ Add connections (list of tuple pairs) to graph """
 
+        if self._incremental:
+            for node1, node2 in connections:
+                self.add(node1, node2)
+            return
+        # Bulk insert: the memoized results are dropped once, not per edge
         for node1, node2 in connections:
-            self.add(node1, node2)
+            self._insert(node1, node2)
+        self._clear_caches()
 
     def add(self, node1, node2):
         """ Add connection between node1 and node2 """
 
+        if node2 in self._graph.get(node1, ()):
+            return  # already connected, nothing to update
+        if self._incremental:
+            self._insert_incrementally(node1, node2)
+            return
+        self._insert(node1, node2)
+        self._clear_caches()
+
+    def _insert(self, node1, node2):
         self._graph[node1].add(node2)
         if not self._directed:
             self._graph[node2].add(node1)
+        else:
+            # Register sinks too so every vertex shows up when iterating
+            self._graph.setdefault(node2, set())
+
+    def _loopless_degree(self, vertex):
+        """Degree ignoring a self-loop, which never closes a triangle"""
+        neighbors = self._graph[vertex]
+        return len(neighbors) - (vertex in neighbors)
+
+    def _local_clustering(self, vertex):
+        """Clustering coefficient from the maintained triangle count"""
+        degree = self._loopless_degree(vertex)
+        if degree < 2:
+            return 0.0
+        return self._triangles.get(vertex, 0) / (degree * (degree - 1) / 2)
+
+    def _insert_incrementally(self, node1, node2):
+        """Insert an edge and patch the maintained metrics around it"""
+        graph = self._graph
+        undirected = not self._directed
+        changed = {node1, node2} if undirected else {node1}  # degree grows
+        # Vertices already adjacent to both endpoints gain a triangle
+        common = set()
+        if undirected and node1 != node2 and node1 in graph and node2 in graph:
+            common = graph[node1] & graph[node2]
+        affected = [v for v in changed | common if v in graph]
+        for vertex in changed:
+            if vertex in graph:
+                self._degree_counts[len(graph[vertex])] -= 1
+        if undirected:
+            self._clustering_sum -= sum(self._local_clustering(v) for v in affected)
+
+        new_sink = self._directed and node2 != node1 and node2 not in graph
+        self._insert(node1, node2)
+
+        for vertex in changed:
+            self._degree_counts[len(graph[vertex])] += 1
+        if new_sink:
+            self._degree_counts[0] += 1
+        if undirected:
+            triangles = self._triangles
+            for vertex in common:
+                triangles[vertex] += 1
+            for vertex in changed:
+                triangles[vertex] = triangles.get(vertex, 0) + len(common)
+            self._clustering_sum += sum(self._local_clustering(v) for v in changed | common)
+        self._components.union(node1, node2)
+
+        # An insertion can only shorten distances, and only for sources
+        # where it creates a shortcut; every other cached row stays exact.
+        for source, distances in list(self._distance_cache.items()):
+            d1, d2 = distances.get(node1), distances.get(node2)
+            if self._directed:
+                stale = d1 is not None and (d2 is None or d2 > d1 + 1)
+            else:
+                stale = (d1 is None) != (d2 is None) or (d1 is not None and abs(d1 - d2) > 1)
+            if stale:
+                del self._distance_cache[source]
+                self._distance_cache_size -= len(distances)
+        self._forward = None
+        self._adjacency = None
+
+    def _clear_caches(self):
+        """Drop every memoized result; called whenever the edges change"""
+        self._distance_cache = OrderedDict()  # source -> {vertex: BFS distance}, LRU order
+        self._distance_cache_size = 0  # distances stored across all rows
+        self._forward = None  # degree-ordered orientation for triangle counting
+        self._triangles = None  # vertex -> triangles through it
+        self._adjacency = None  # scipy.sparse adjacency matrix and its labels
+
+    @instrument.timed
+    def freeze(self):
+        """ Compile into a read-only CSRGraph keyed by dense integer ids """
+
+        labels = list(self._graph)
+        ids = {label: i for i, label in enumerate(labels)}
+        degrees = np.fromiter((len(self._graph[label]) for label in labels),
+                              dtype=np.int64, count=len(labels))
+        indptr = np.zeros(len(labels) + 1, dtype=np.int64)
+        np.cumsum(degrees, out=indptr[1:])
+        # Rows are sorted so neighbor lists can be intersected by merging
+        indices = np.fromiter((i for label in labels
+                               for i in sorted(ids[w] for w in self._graph[label])),
+                              dtype=_index_dtype(len(labels)), count=int(indptr[-1]))
+        return CSRGraph(indptr, indices, labels, directed=self._directed)
 
     def is_connected(self, node1, node2):
         """ Is node1 directly connected to node2 """
 
         return node1 in self._graph and node2 in self._graph[node1]
 
+    def bfs_order(self, source):
+        """Yield (vertex, distance) pairs in BFS visit order, lazily"""
+        depth = {source: 0}
+        queue = deque([source])
+        while queue:
+            current = queue.popleft()
+            yield current, depth[current]
+            for neighbor in self._graph.get(current, ()):
+                if neighbor not in depth:
+                    depth[neighbor] = depth[current] + 1
+                    queue.append(neighbor)
+
+    def _count_traversal(self, vertices):
+        """Record one BFS over vertices with instrument (only when enabled)"""
+        instrument.count('bfs_runs')
+        instrument.count('vertices_expanded', len(vertices))
+        instrument.count('edges_scanned', sum(len(self._graph.get(v, ())) for v in vertices))
+
+    def _bfs_tree(self, source, goal=None):
+        """BFS into the reusable parent/depth buffers, stopping at goal if given"""
+        parent, depth = self._parent, self._depth
+        parent.clear()
+        depth.clear()
+        parent[source], depth[source] = None, 0
+        queue = deque([source])
+        found = False
+        while queue and not found:
+            current = queue.popleft()
+            for neighbor in self._graph.get(current, ()):
+                if neighbor not in depth:
+                    parent[neighbor] = current
+                    depth[neighbor] = depth[current] + 1
+                    if neighbor == goal:
+                        found = True
+                        break
+                    queue.append(neighbor)
+        if instrument.enabled:
+            self._count_traversal(depth)
+        return found
+
+    def _path_to(self, goal):
+        """Rebuild the path to goal from the last _bfs_tree's parents"""
+        if goal not in self._depth:
+            return None
+        path = []
+        while goal is not None:
+            path.append(goal)
+            goal = self._parent[goal]
+        path.reverse()
+        return path
+
+    def _depth_of(self, goal):
+        return self._depth.get(goal, float('inf'))
+
+    @instrument.timed
     def find_shortest_path(self, start, goal):
         """Find the shortest path using BFS"""
         if start == goal:
             return [start]
-        visited = {start}
-        queue = deque([(start, [start])])
+        self._bfs_tree(start, goal)
+        path = self._path_to(goal)
+        if path is not None:
+            instrument.count('paths_materialized')
+        return path
+
+    def _distances_from(self, source, memoize=True):
+        """Distances from source to every reachable vertex, one BFS per source
+
+        A memoized row is reused whenever present; memoize=False skips
+        storing a fresh one, which sweeps over many sources rely on.
+        """
+        distances = self._cached_distances(source)
+        if distances is not None:
+            return distances
+        distances = self._bfs_distances(source)
+        if memoize:
+            self._remember_distances(source, distances)
+        return distances
+
+    def _bfs_distances(self, source):
+        distances = {source: 0}
+        queue = deque([source])
         while queue:
-            current, path = queue.popleft()
-            for neighbor in self._graph[current]:
-                if neighbor not in visited:
-                    if neighbor == goal:
-                        return path + [neighbor]
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
-        return None
+            current = queue.popleft()
+            for neighbor in self._graph.get(current, ()):
+                if neighbor not in distances:
+                    distances[neighbor] = distances[current] + 1
+                    queue.append(neighbor)
+        if instrument.enabled:
+            self._count_traversal(distances)
+        return distances
+
+    def _cached_distances(self, source):
+        """The memoized row for source, marked most recently used, or None"""
+        distances = self._distance_cache.get(source)
+        if distances is not None:
+            self._distance_cache.move_to_end(source)
+        return distances
 
-    def closeness_centrality(self, nodes):
-        """Calculate the closeness centrality for specified nodes"""
+    def _remember_distances(self, source, distances):
+        """Cache a BFS row, evicting the least recently used ones over the limit"""
+        if len(distances) > self.distance_cache_limit:
+            return
+        self._distance_cache[source] = distances
+        self._distance_cache_size += len(distances)
+        while self._distance_cache_size > self.distance_cache_limit:
+            _, evicted = self._distance_cache.popitem(last=False)
+            self._distance_cache_size -= len(evicted)
+
+    def _shard_sources(self, method, sources, workers):
+        """Run method over chunks of sources, in a forked pool if workers > 1
+
+        Returns the partial results in chunk order so callers can reduce
+        them deterministically.
+        """
+        global _SHARED_GRAPH
+        sources = list(sources)
+        if not workers or workers <= 1 or len(sources) < 2:
+            return [getattr(self, method)(sources)]
+        pieces = min(len(sources), workers * 4)
+        bounds = [len(sources) * k // pieces for k in range(pieces + 1)]
+        tasks = [(method, sources[lo:hi]) for lo, hi in zip(bounds, bounds[1:])]
+        _SHARED_GRAPH = self
+        try:
+            with multiprocessing.get_context('fork').Pool(workers) as pool:
+                return pool.map(_run_shard, tasks)
+        finally:
+            _SHARED_GRAPH = None
+
+    def _closeness(self, nodes):
         centrality = {}
         for node in nodes:
-            sum_of_distances = sum(len(self.find_shortest_path(node, other)) - 1
-                                   for other in self._graph if other != node)
+            sum_of_distances = sum(self._distances_from(node, memoize=False).values())
             centrality[node] = 1 / sum_of_distances if sum_of_distances > 0 else 0
         return centrality
 
+    @instrument.timed
+    def closeness_centrality(self, nodes=None, workers=None):
+        """Calculate the closeness centrality for specified nodes (all by default)"""
+        if nodes is None:
+            nodes = self._graph
+        centrality = {}
+        for partial in self._shard_sources('_closeness', nodes, workers):
+            centrality.update(partial)
+        return centrality
+
+    @instrument.timed
     def eccentricity(self, vertex):
         """Calculate the eccentricity of a given vertex"""
-        max_distance = 0
-        for other in self._graph:
-            if other != vertex:
-                path = self.find_shortest_path(vertex, other)
-                if path:
-                    distance = len(path) - 1
-                    max_distance = max(max_distance, distance)
-                else:
-                    # Assuming infinity for disconnected components
-                    return float('inf')
-        return max_distance
+        return self._eccentricity(self._distances_from(vertex))
+
+    def _eccentricity(self, distances):
+        if len(distances) < len(self._graph):
+            # Assuming infinity for disconnected components
+            return float('inf')
+        return max(distances.values())
+
+    def _eccentricities(self, vertices):
+        return {vertex: self._eccentricity(self._distances_from(vertex, memoize=False))
+                for vertex in vertices}
+
+    @instrument.timed
+    def eccentricities(self, vertices=None, workers=None):
+        """Calculate the eccentricity of several vertices (all by default)"""
+        if vertices is None:
+            vertices = self._graph
+        result = {}
+        for partial in self._shard_sources('_eccentricities', vertices, workers):
+            result.update(partial)
+        return result
     
 
+    @instrument.timed
     def find_all_paths(self, start, goal):
         """Find all paths between start and goal (not just the shortest)"""
         if start == goal:
             return [[start]]
         paths = []
-        queue = deque([(start, [start])])
-        while queue:
-            (vertex, path) = queue.popleft()
-            for next in set(self._graph[vertex]) - set(path):
+        # Depth-first with one shared path; only complete paths are copied
+        path, on_path = [start], {start}
+        stack = [iter(self._graph.get(start, ()))]
+        while stack:
+            for next in stack[-1]:
+                if next in on_path:
+                    continue
                 if next == goal:
                     paths.append(path + [next])
-                else:
-                    queue.append((next, path + [next]))
+                    continue
+                path.append(next)
+                on_path.add(next)
+                stack.append(iter(self._graph.get(next, ())))
+                break
+            else:
+                stack.pop()
+                on_path.discard(path.pop())
+        paths.sort(key=len)  # shortest first, as the old BFS produced them
+        instrument.count('paths_materialized', len(paths))
         return paths
 
-    def betweenness_centrality(self, vertices):
-        """Calculate the betweenness centrality for specific vertices"""
-        centrality = dict.fromkeys(vertices, 0.0)
-        for start in self._graph:
-            for goal in self._graph:
-                if start != goal:
-                    all_paths = self.find_all_paths(start, goal)
-                    total_paths = len(all_paths)
-                    if total_paths > 0:
-                        for vertex in vertices:
-                            paths_through_vertex = sum(vertex in path for path in all_paths)
-                            centrality[vertex] += paths_through_vertex / total_paths
-        # Optionally, normalize the centrality values here
-        return centrality
+    def _single_source_dependencies(self, source):
+        """Brandes dependencies of every vertex reachable from source"""
+        order = []
+        predecessors = defaultdict(list)
+        sigma = {source: 1}  # number of shortest paths from source
+        distance = {source: 0}
+        queue = deque([source])
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            for neighbor in self._graph.get(current, ()):
+                if neighbor not in distance:
+                    distance[neighbor] = distance[current] + 1
+                    sigma[neighbor] = 0
+                    queue.append(neighbor)
+                if distance[neighbor] == distance[current] + 1:
+                    sigma[neighbor] += sigma[current]
+                    predecessors[neighbor].append(current)
+        dependency = dict.fromkeys(order, 0.0)
+        for vertex in reversed(order):
+            for pred in predecessors[vertex]:
+                dependency[pred] += sigma[pred] / sigma[vertex] * (1 + dependency[vertex])
+        del dependency[source]
+        if instrument.enabled:
+            self._count_traversal(order)
+        return dependency
+
+    def _dependency_totals(self, sources):
+        totals = defaultdict(float)
+        for source in sources:
+            for vertex, dependency in self._single_source_dependencies(source).items():
+                totals[vertex] += dependency
+        return totals
+
+    @instrument.timed
+    def betweenness_centrality(self, vertices=None, normalized=False, workers=None):
+        """Calculate the betweenness centrality using Brandes' algorithm
+
+        One BFS per source counts the shortest paths through every vertex,
+        so all vertices are scored in a single pass. Pass vertices=None to
+        get the whole graph. Scaling follows networkx: undirected scores are
+        halved, and normalized=True divides by (n-1)(n-2).
+        """
+        centrality = dict.fromkeys(self._graph, 0.0)
+        for partial in self._shard_sources('_dependency_totals', self._graph, workers):
+            for vertex, dependency in partial.items():
+                centrality[vertex] += dependency
+
+        n = len(self._graph)
+        if normalized:
+            scale = 1 / ((n - 1) * (n - 2)) if n > 2 else None
+        else:
+            scale = None if self._directed else 0.5
+        if scale is not None:
+            for vertex in centrality:
+                centrality[vertex] *= scale
+
+        if vertices is None:
+            return centrality
+        return {vertex: centrality.get(vertex, 0.0) for vertex in vertices}
     
+    @instrument.timed
     def find_shortest_path_length(self, start, goal):
         """Find the shortest path length using BFS"""
+        cached = self._cached_distances(start)
+        if cached is not None:
+            return cached.get(goal, float('inf'))
         if start == goal:
             return 0
-        visited = set([start])
-        queue = deque([(start, 0)])
-        while queue:
-            (current, distance) = queue.popleft()
-            for neighbor in self._graph[current]:
-                if neighbor not in visited:
-                    if neighbor == goal:
-                        return distance + 1
-                    visited.add(neighbor)
-                    queue.append((neighbor, distance + 1))
-        return float('inf')  # Return infinity if no path exists
+        self._bfs_tree(start, goal)
+        return self._depth_of(goal)  # infinity if no path exists
+
+    def _path_length_totals(self, starts):
+        """Sum and count of reachable distances to vertices after each start"""
+        vertices = list(self._graph)
+        position = {vertex: i for i, vertex in enumerate(vertices)}
+        total = count = 0
+        for start in starts:
+            distances = self._distances_from(start, memoize=False)
+            for goal in vertices[position[start] + 1:]:
+                if goal in distances:
+                    total += distances[goal]
+                    count += 1
+        return total, count
 
-    def average_shortest_path_length(self):
+    @instrument.timed
+    def average_shortest_path_length(self, workers=None):
         """Calculate the average shortest path length in the graph"""
-        path_lengths = []
-        for (start, goal) in combinations(self._graph, 2):
-            path_length = self.find_shortest_path_length(start, goal)
-            if path_length != float('inf'):
-                path_lengths.append(path_length)
-
-        if path_lengths:
-            return sum(path_lengths) / len(path_lengths)
+        partials = self._shard_sources('_path_length_totals', self._graph, workers)
+        total = sum(partial[0] for partial in partials)
+        count = sum(partial[1] for partial in partials)
+
+        if count:
+            return total / count
         else:
             return 0
         
-    def plot_degree_distribution(self):
-        """Plot the degree distribution of the graph"""
-        degrees = [len(self._graph[node]) for node in self._graph]
-        degree_counts = Counter(degrees)
-        fig, ax = plt.subplots()
-        ax.bar(degree_counts.keys(), degree_counts.values(), color='b')
+    def _sampled_sources(self, k, epsilon, delta, seed, time_budget):
+        """Yield pivot sources drawn uniformly (with replacement) by a seeded RNG
+
+        Draws k pivots, or enough for a Hoeffding error of epsilon (as a
+        fraction of the estimator's range) at confidence 1 - delta, or with
+        time_budget (seconds) keeps drawing until it runs out, always
+        yielding at least one. An empty graph yields none.
+        """
+        if k is None and epsilon is None and time_budget is None:
+            raise ValueError('give k, epsilon or time_budget')
+        vertices = list(self._graph)
+        if not vertices:
+            return
+        rng = random.Random(seed)
+        if time_budget is not None:
+            deadline = time.perf_counter() + time_budget
+            yield rng.choice(vertices)
+            while time.perf_counter() < deadline:
+                yield rng.choice(vertices)
+            return
+        if k is None:
+            k = math.ceil(math.log(2 / delta) / (2 * epsilon ** 2))
+        for _ in range(k):
+            yield rng.choice(vertices)
+
+    @instrument.timed
+    def approximate_betweenness(self, k=None, epsilon=None, delta=0.1, seed=0,
+                                time_budget=None, normalized=True):
+        """Estimate betweenness from the dependencies of sampled pivot sources
+
+        Scales the summed dependencies of the pivots by n / k (Brandes and
+        Pich). The error is a per-vertex Hoeffding bound, with the same
+        scaling as the value.
+        """
+        n = len(self._graph)
+        totals = dict.fromkeys(self._graph, 0.0)
+        samples = 0
+        for source in self._sampled_sources(k, epsilon, delta, seed, time_budget):
+            samples += 1
+            for vertex, dependency in self._single_source_dependencies(source).items():
+                totals[vertex] += dependency
+        if n <= 2:
+            return Estimate(dict.fromkeys(totals, 0.0), 0.0, samples)
+        # Each pivot's normalized contribution n*dep/((n-1)(n-2)) lies in [0, n/(n-1)]
+        scale = n / samples / ((n - 1) * (n - 2))
+        error = n / (n - 1) * _hoeffding(samples, delta)
+        if not normalized:
+            unnormalized = (n - 1) * (n - 2) * (1 if self._directed else 0.5)
+            scale *= unnormalized
+            error *= unnormalized
+        return Estimate({v: total * scale for v, total in totals.items()}, error, samples)
+
+    @instrument.timed
+    def approximate_closeness(self, nodes=None, k=None, epsilon=None, delta=0.1, seed=0,
+                              time_budget=None):
+        """Estimate closeness_centrality from distances to sampled pivots
+
+        The sum of distances from a vertex is estimated as n / k times the
+        sum of its distances to the pivots (Eppstein and Wang), which needs
+        d(pivot, v) = d(v, pivot), so the graph must be undirected.
+        """
+        if self._directed:
+            raise ValueError('approximate closeness needs an undirected graph')
+        nodes = list(self._graph) if nodes is None else list(nodes)
+        n = len(self._graph)
+        sums = dict.fromkeys(nodes, 0)
+        samples = longest = 0
+        for source in self._sampled_sources(k, epsilon, delta, seed, time_budget):
+            samples += 1
+            distances = self._distances_from(source, memoize=False)
+            longest = max(longest, max(distances.values()))
+            for node in nodes:
+                sums[node] += distances.get(node, 0)
+        if not samples:
+            return Estimate(dict.fromkeys(nodes, 0), dict.fromkeys(nodes, 0.0), 0)
+        # Distances are at most the diameter, itself at most twice any eccentricity
+        margin = n * 2 * longest * _hoeffding(samples, delta)
+        value, error = {}, {}
+        for node, total in sums.items():
+            estimate = n * total / samples
+            value[node] = 1 / estimate if estimate > 0 else 0
+            error[node] = (1 / (estimate - margin) - value[node] if estimate > margin
+                           else float('inf'))
+        return Estimate(value, error, samples)
+
+    @instrument.timed
+    def approximate_average_shortest_path_length(self, k=None, epsilon=None, delta=0.1,
+                                                 seed=0, time_budget=None):
+        """Estimate the average shortest path length from sampled pivot sources
+
+        Averages the distances from each pivot to every vertex it reaches.
+        The error bound assumes a connected graph, where each pivot's mean
+        distance is an unbiased sample in [0, diameter].
+        """
+        total = count = samples = longest = 0
+        for source in self._sampled_sources(k, epsilon, delta, seed, time_budget):
+            samples += 1
+            distances = self._distances_from(source, memoize=False)
+            total += sum(distances.values())
+            count += len(distances) - 1
+            longest = max(longest, max(distances.values()))
+        if not samples:
+            return Estimate(0, 0.0, 0)
+        value = total / count if count else 0
+        return Estimate(value, 2 * longest * _hoeffding(samples, delta), samples)
+
+    def degrees(self):
+        """Degree (out-degree if directed) of every vertex, in iteration order"""
+        return np.fromiter((len(self._graph[node]) for node in self._graph),
+                           dtype=np.int64, count=len(self._graph))
+
+    @instrument.timed
+    def degree_histogram(self):
+        """Number of vertices with each degree, indexed by degree"""
+        if self._incremental:
+            counts = {d: c for d, c in self._degree_counts.items() if c}
+            histogram = np.zeros(max(counts, default=-1) + 1, dtype=np.int64)
+            histogram[list(counts)] = list(counts.values())
+            return histogram
+        return np.bincount(self.degrees())
+
+    @instrument.timed
+    def plot_degree_distribution(self, path=None, format=None):
+        """Plot the degree distribution of the graph
+
+        With a path (file name or binary buffer) the figure is rendered
+        off-screen and saved, e.g. as PNG or SVG, without touching a GUI
+        backend; without one it is shown interactively. matplotlib is only
+        imported here.
+        """
+        if path is None:
+            from matplotlib import pyplot as plt
+            fig = plt.figure()
+        else:
+            from matplotlib.figure import Figure
+            fig = Figure()
+        counts = self.degree_histogram()
+        degrees = np.flatnonzero(counts)
+        ax = fig.add_subplot()
+        ax.bar(degrees, counts[degrees], color='b')
 
         ax.set_xlabel('Degree')
         ax.set_ylabel('Number of vertices')
         ax.set_title('Degree distribution of the graph')
 
-        plt.show()
+        if path is None:
+            plt.show()
+        else:
+            fig.savefig(path, format=format)
+        return fig
+
+    def _triangle_shard(self, vertices):
+        counts = defaultdict(int)
+        forward = self._forward
+        for u in vertices:
+            later = forward[u]
+            for v in later:
+                # Each triangle is found once, from its lowest-ranked vertex
+                for w in later & forward[v]:
+                    counts[u] += 1
+                    counts[v] += 1
+                    counts[w] += 1
+        return counts
+
+    @instrument.timed
+    def triangle_counts(self, workers=None):
+        """Count the triangles through every vertex of an undirected graph
+
+        Edges are oriented from lower to higher degree, so each vertex only
+        intersects its (at most sqrt(2E)) higher-ranked neighbors and hubs
+        never pay for their full degree squared.
+        """
+        if self._directed:
+            raise ValueError('triangle counting needs an undirected graph')
+        if self._triangles is None:
+            order = sorted(self._graph, key=lambda vertex: len(self._graph[vertex]))
+            rank = {vertex: i for i, vertex in enumerate(order)}
+            self._forward = {u: {v for v in self._graph[u] if rank[v] > rank[u]}
+                             for u in self._graph}
+            triangles = dict.fromkeys(self._graph, 0)
+            for partial in self._shard_sources('_triangle_shard', self._graph, workers):
+                for vertex, count in partial.items():
+                    triangles[vertex] += count
+            self._triangles = triangles
+        return self._triangles
 
     def clustering_coefficient(self, vertex):
         """Calculate the clustering coefficient for a given vertex"""
-        neighbors = self._graph[vertex]
+        neighbors = {v for v in self._graph[vertex] if v != vertex}
         if len(neighbors) < 2:
             return 0.0  # No triangle is possible
         possible_links = len(neighbors) * (len(neighbors) - 1) / 2
+        if not self._directed:
+            return self.triangle_counts()[vertex] / possible_links
         actual_links = 0
         for v1 in neighbors:
             for v2 in neighbors:
@@ -156,52 +734,495 @@ class Graph(object):
         actual_links /= 2
         return actual_links / possible_links
     
-    def average_clustering_coefficient(self):
+    def _clustering_total(self, vertices):
+        return sum(self.clustering_coefficient(vertex) for vertex in vertices)
+
+    @instrument.timed
+    def average_clustering_coefficient(self, workers=None):
         """Calculate the average clustering coefficient of the graph"""
-        total_clustering = 0.0
-        for vertex in self._graph:
-            total_clustering += self.clustering_coefficient(vertex)
+        if self._incremental and not self._directed:
+            return self._clustering_sum / len(self._graph) if self._graph else 0
+        if not self._directed:
+            self.triangle_counts(workers)
+            workers = None  # the remaining per-vertex work is a lookup
+        total_clustering = sum(self._shard_sources('_clustering_total', self._graph, workers))
         return total_clustering / len(self._graph) if self._graph else 0
 
+    @instrument.timed
+    def connected_components(self):
+        """ Vertex sets of the (weakly, if directed) connected components """
+
+        if self._incremental:
+            components = self._components
+        else:
+            components = UnionFind(self._graph)
+            for node in self._graph:
+                for neighbor in self._graph[node]:
+                    components.union(node, neighbor)
+        return list(components.groups().values())
+
+    def _tighten_bounds(self, source, vertices, lower, upper):
+        """BFS from source and tighten the eccentricity bounds of vertices
+
+        From a source with eccentricity e, each w has max(d, e - d) <= ecc(w)
+        <= e + d, where d is its distance from the source (Takes and
+        Kosters). Returns e.
+        """
+        distances = self._distances_from(source, memoize=False)
+        e = max(distances.values())
+        for w in vertices:
+            d = distances[w]
+            lower[w] = max(lower[w], d, e - d)
+            upper[w] = min(upper[w], e + d)
+        return e
+
+    def _bound_eccentricities(self, component, keep=None):
+        """Takes-Kosters eccentricity bounds over one connected component
+
+        BFS sources alternate between the largest upper bound (ties going to
+        the lowest degree, likely peripheral) and the smallest lower bound
+        (ties going to the highest degree, likely central) among the
+        candidates, and a vertex stops being one once its bounds meet.
+        keep(w, lower, upper, radius, diameter) may drop more candidates,
+        given the current radius upper bound and diameter lower bound.
+        Returns (lower, upper, resolved eccentricities, BFS runs).
+        """
+        lower = dict.fromkeys(component, 0)
+        upper = dict.fromkeys(component, float('inf'))
+        degree = {w: len(self._graph[w]) for w in component}
+        eccentricity = {}
+        candidates = set(component)
+        pick_upper = True
+        runs = 0
+        while candidates:
+            if pick_upper:
+                source = max(candidates, key=lambda w: (upper[w], -degree[w]))
+            else:
+                source = min(candidates, key=lambda w: (lower[w], -degree[w]))
+            pick_upper = not pick_upper
+            self._tighten_bounds(source, candidates, lower, upper)
+            runs += 1
+            for w in list(candidates):
+                if lower[w] == upper[w]:
+                    eccentricity[w] = lower[w]
+                    candidates.discard(w)
+            if keep is not None:
+                radius, diameter = min(upper.values()), max(lower.values())
+                candidates = {w for w in candidates if keep(w, lower, upper, radius, diameter)}
+        return lower, upper, eccentricity, runs
+
+    @instrument.timed
+    def component_distance_measures(self, all_eccentricities=True):
+        """ Eccentricities, radius, diameter, center and periphery per component
+
+        With all_eccentricities=False the 'eccentricity' dict only holds the
+        vertices resolved before the center and periphery were settled.
+        Returns one dict per component, largest first.
+        """
+        if self._directed:
+            raise ValueError('component distance measures need an undirected graph')
+        keep = None if all_eccentricities else _keep_center_or_periphery
+        results = []
+        for component in sorted(self.connected_components(), key=len, reverse=True):
+            lower, upper, eccentricity, runs = self._bound_eccentricities(component, keep)
+            radius = min(upper.values())
+            diameter = max(lower.values())
+            results.append({
+                'vertices': component,
+                'eccentricity': eccentricity,
+                'radius': radius,
+                'diameter': diameter,
+                'center': [v for v, e in eccentricity.items() if e == radius],
+                'periphery': [v for v, e in eccentricity.items() if e == diameter],
+                'bfs_runs': runs,
+            })
+        return results
+
+    @instrument.timed
+    def radius_and_diameter(self):
+        """ Radius and diameter of every component, without the center or periphery
+
+        Returns one dict per component, largest first, with its vertices,
+        radius, diameter and bfs_runs.
+        """
+        if self._directed:
+            raise ValueError('component distance measures need an undirected graph')
+        results = []
+        for component in sorted(self.connected_components(), key=len, reverse=True):
+            lower, upper, _, runs = self._bound_eccentricities(component, _keep_unsettled)
+            results.append({
+                'vertices': component,
+                'radius': min(upper.values()),
+                'diameter': max(lower.values()),
+                'bfs_runs': runs,
+            })
+        return results
+
+    @instrument.timed
+    def transitivity(self):
+        """Fraction of connected triples that close into triangles"""
+        degrees = [self._loopless_degree(v) for v in self._graph]
+        triples = sum(d * (d - 1) / 2 for d in degrees)
+        return sum(self.triangle_counts().values()) / triples if triples else 0
+
+    def adjacency_matrix(self):
+        """SciPy CSR adjacency matrix and the vertex label of each row"""
+        if self._adjacency is None:
+            from scipy.sparse import csr_matrix
+            frozen = self.freeze()
+            n = len(frozen.labels)
+            matrix = csr_matrix((np.ones(len(frozen.indices)), frozen.indices, frozen.indptr),
+                                shape=(n, n))
+            self._adjacency = matrix, frozen.labels
+        return self._adjacency
+
+    def _start_vectors(self, labels, vectors):
+        """Stack label->weight dicts into a column-normalized (n, k) array"""
+        columns = np.zeros((len(labels), len(vectors)))
+        for k, vector in enumerate(vectors):
+            columns[:, k] = [vector.get(label, 0) for label in labels]
+        totals = columns.sum(axis=0)
+        if np.any(totals == 0):
+            raise ValueError('start and personalization vectors need a non-zero entry')
+        return columns / totals
+
+    @instrument.timed
+    def eigenvector_centrality(self, max_iter=100, tol=1e-6, nstart=None):
+        """Calculate eigenvector centrality by power iteration
+
+        Iterates x <- x + A^T x (the shift keeps bipartite graphs from
+        oscillating), normalizing each step, until the L1 change drops below
+        n * tol. nstart is an optional label->value dict to warm-start from.
+        """
+        matrix, labels = self.adjacency_matrix()
+        n = len(labels)
+        if n == 0:
+            return {}
+        x = (self._start_vectors(labels, [nstart])[:, 0] if nstart
+             else np.full(n, 1.0 / n))
+        transpose = matrix.T.tocsr()
+        for _ in range(max_iter):
+            last = x
+            x = last + transpose @ last
+            x /= np.linalg.norm(x) or 1
+            if np.abs(x - last).sum() < n * tol:
+                return dict(zip(labels, x.tolist()))
+        raise RuntimeError(f'eigenvector centrality did not converge in {max_iter} iterations')
+
+    @instrument.timed
+    def pagerank(self, alpha=0.85, personalization=None, max_iter=100, tol=1e-6, nstart=None):
+        """Calculate PageRank by power iteration over the sparse adjacency matrix
+
+        personalization may be a label->weight dict or a list of them; a
+        list is solved as one batch, one column per vector, and returns a
+        list of results. Dangling vertices teleport by the personalization,
+        as in networkx. nstart warm-starts every column from a previous
+        result.
+        """
+        matrix, labels = self.adjacency_matrix()
+        n = len(labels)
+        if n == 0:
+            return [] if isinstance(personalization, list) else {}
+        batch = personalization if isinstance(personalization, list) else [personalization]
+        p = np.column_stack([np.full(n, 1.0 / n) if vector is None
+                             else self._start_vectors(labels, [vector])[:, 0]
+                             for vector in batch])
+        x = (np.repeat(self._start_vectors(labels, [nstart]), len(batch), axis=1) if nstart
+             else np.full((n, len(batch)), 1.0 / n))
+        out_degree = np.asarray(matrix.sum(axis=1)).ravel()
+        dangling = out_degree == 0
+        inverse_degree = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+        transition = matrix.T.tocsr()
+        for _ in range(max_iter):
+            last = x
+            x = alpha * (transition @ (last * inverse_degree[:, None]))
+            x += (alpha * last[dangling].sum(axis=0) + (1 - alpha)) * p
+            if np.all(np.abs(x - last).sum(axis=0) < n * tol):
+                results = [dict(zip(labels, column)) for column in x.T.tolist()]
+                return results if isinstance(personalization, list) else results[0]
+        raise RuntimeError(f'pagerank did not converge in {max_iter} iterations')
+
     def __str__(self):
         return '{}({})'.format(self.__class__.__name__, dict(self._graph))
-    
-connections = [
-    ('1', '2'), ('1', '3'),
-    ('2', '3'),
-    ('3', '4'), ('3', '5'), ('3', '12'),
-    ('4', '5'),
-    ('5', '11'),
-    ('6', '7'), ('6', '12'),
-    ('7', '12'),
-    ('8', '12'),
-    ('9', '12'),
-    ('10', '12'),
-    ('11', '12')
-]
-g = Graph(connections, directed=False)
-
-#question 1
-specific_nodes_centrality = g.closeness_centrality(nodes=['3', '12'])
-print(f"Closeness centrality for nodes 3 and 12: {specific_nodes_centrality}")  #currently wrong
-#question 2
-eccentricity_of_vertex_3 = g.eccentricity('3')
-print(f"Eccentricity of vertex 3: {eccentricity_of_vertex_3}")
-eccentricity_of_vertex_12 = g.eccentricity('12')
-print(f"Eccentricity of vertex 12: {eccentricity_of_vertex_12}")
-eccentricity_of_vertex_11 = g.eccentricity('11')
-print(f"Eccentricity of vertex 11: {eccentricity_of_vertex_11}")
-#question 3
-specific_vertices_centrality = g.betweenness_centrality(['3', '12'])
-print(f"Betweenness centrality for vertices 3 and 12: {specific_vertices_centrality}")  #currently wrong
-#question 5
-average_length = g.average_shortest_path_length()
-print(f"Average shortest path length: {average_length}")
-#question 6, commented out because it stops the code until I close it and am lazy
-g.plot_degree_distribution()
-#question 7
-clustering_coefficient_of_vertex_3 = g.clustering_coefficient('3')
-print(f"Clustering coefficient of vertex 3: {clustering_coefficient_of_vertex_3}")
-#question 8
-average_clustering = g.average_clustering_coefficient()
-print(f"Average clustering coefficient: {average_clustering}")
\ No newline at end of file
+
+
+def default_delimiter(path):
+    """',' for .csv, tab for .tsv and None (any whitespace) otherwise, ignoring .gz"""
+    name = path[:-3] if path.endswith('.gz') else path
+    return {'.csv': ',', '.tsv': '\t'}.get(os.path.splitext(name)[1])
+
+
+@instrument.timed
+def load_edge_list(path, delimiter=None, directed=False, chunk_size=100000,
+                   comments='#', skip_header=False, graph=None):
+    """Stream an edge-list file into a Graph, chunk_size edges at a time
+
+    Each line holds two vertex labels; extra columns are ignored, and a line
+    with fewer raises ValueError naming the file and line. The delimiter
+    defaults to ',' for .csv, tab for .tsv and whitespace otherwise, and
+    files ending in .gz are decompressed on the fly. Each chunk goes in
+    with one bulk add_connections call, so only chunk_size parsed edges are
+    held at once. Edges are added to graph if one is given.
+    """
+    if graph is None:
+        graph = Graph([], directed=directed)
+    if delimiter is None:
+        delimiter = default_delimiter(path)
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt') as f:
+        if skip_header:
+            next(f, None)
+        chunk = []
+        for number, line in enumerate(f, start=2 if skip_header else 1):
+            line = line.strip()
+            if not line or line.startswith(comments):
+                continue
+            fields = [field.strip() for field in line.split(delimiter)]
+            if len(fields) < 2 or not fields[0] or not fields[1]:
+                raise ValueError(f"{path}:{number}: expected two vertex labels, got {line!r}")
+            chunk.append((fields[0], fields[1]))
+            if len(chunk) >= chunk_size:
+                graph.add_connections(chunk)
+                chunk = []
+        graph.add_connections(chunk)
+    return graph
+
+
+def _index_dtype(n):
+    """Smallest integer dtype able to hold vertex ids 0..n-1"""
+    return np.int32 if n < 2 ** 31 else np.int64
+
+
+class _CSRAdjacency(Mapping):
+    """Read-only label -> neighbor labels view over a CSRGraph's arrays"""
+
+    def __init__(self, csr):
+        self._csr = csr
+
+    def __getitem__(self, label):
+        i = self._csr.ids[label]
+        return [self._csr.labels[j] for j in self._csr.neighbor_ids(i).tolist()]
+
+    def __contains__(self, label):
+        return label in self._csr.ids
+
+    def __iter__(self):
+        return iter(self._csr.labels)
+
+    def __len__(self):
+        return len(self._csr.labels)
+
+
+class CSRGraph(Graph):
+    """ Frozen graph stored as CSR arrays (indptr, indices) over integer ids.
+
+    labels[i] is the original label of vertex i and ids maps labels back to
+    ids. Every Graph method works on it unchanged; the BFS kernels behind
+    the metrics run directly on the arrays.
+    """
+
+    def __init__(self, indptr, indices, labels, directed=False):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices)
+        self.labels = list(labels)
+        self.ids = {label: i for i, label in enumerate(self.labels)}
+        self._directed = directed
+        self._incremental = False
+        self._clear_caches()
+        self._graph = _CSRAdjacency(self)
+        self._bfs_buffers = None  # parent, depth and stamp lists, made on first use
+        self._generation = 0
+
+    def add(self, node1, node2):
+        raise TypeError('CSRGraph is read-only; add edges to a Graph and freeze() it again')
+
+    def add_connections(self, connections):
+        raise TypeError('CSRGraph is read-only; add edges to a Graph and freeze() it again')
+
+    def save(self, path):
+        """ Write a snapshot directory: indptr.npy, indices.npy and meta.json """
+
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, 'indptr.npy'), self.indptr)
+        np.save(os.path.join(path, 'indices.npy'), self.indices)
+        with open(os.path.join(path, 'meta.json'), 'w') as f:
+            json.dump({'directed': self._directed, 'labels': self.labels}, f)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """ Open a snapshot written by save()
+
+        With mmap=True the arrays are memory-mapped read-only, so loading
+        is near-instant and processes opening the same snapshot share pages.
+        """
+        mode = 'r' if mmap else None
+        indptr = np.load(os.path.join(path, 'indptr.npy'), mmap_mode=mode)
+        indices = np.load(os.path.join(path, 'indices.npy'), mmap_mode=mode)
+        with open(os.path.join(path, 'meta.json')) as f:
+            meta = json.load(f)
+        return cls(indptr, indices, meta['labels'], directed=meta['directed'])
+
+    def freeze(self):
+        return self
+
+    def degrees(self):
+        return np.diff(self.indptr)
+
+    def neighbor_ids(self, i):
+        """ Integer ids adjacent to vertex id i (a view, sorted) """
+
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def _count_traversal(self, ids):
+        ids = np.asarray(ids, dtype=np.int64)
+        instrument.count('bfs_runs')
+        instrument.count('vertices_expanded', len(ids))
+        instrument.count('edges_scanned', int((self.indptr[ids + 1] - self.indptr[ids]).sum()))
+
+    def _bfs_levels(self, source_id):
+        """Level-synchronous BFS over the arrays; -1 marks unreachable ids"""
+        distance = np.full(len(self.labels), -1, dtype=np.int64)
+        distance[source_id] = 0
+        frontier = np.array([source_id], dtype=np.int64)
+        level = 0
+        while frontier.size:
+            level += 1
+            starts = self.indptr[frontier]
+            lengths = self.indptr[frontier + 1] - starts
+            # Gather every neighbor of the frontier with one fancy index
+            offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+            neighbors = self.indices[offsets + np.arange(offsets.size)]
+            frontier = np.unique(neighbors[distance[neighbors] < 0])
+            distance[frontier] = level
+        if instrument.enabled:
+            self._count_traversal(np.flatnonzero(distance >= 0))
+        return distance
+
+    def _bfs_tree(self, source, goal=None):
+        if self._bfs_buffers is None:
+            n = len(self.labels)
+            self._bfs_buffers = ([-1] * n, [0] * n, [0] * n)
+        parent, depth, stamp = self._bfs_buffers
+        # A vertex was visited by this search iff its stamp is the current
+        # generation, so the buffers never need clearing between searches
+        self._generation += 1
+        generation = self._generation
+        s = self.ids.get(source)
+        if s is None:
+            return False  # unknown start: nothing reached, as in the dict backend
+        goal_id = self.ids.get(goal, -1)
+        parent[s], depth[s], stamp[s] = -1, 0, generation
+        queue = deque([s])
+        found = False
+        while queue and not found:
+            current = queue.popleft()
+            for neighbor in self.neighbor_ids(current).tolist():
+                if stamp[neighbor] != generation:
+                    stamp[neighbor] = generation
+                    parent[neighbor] = current
+                    depth[neighbor] = depth[current] + 1
+                    if neighbor == goal_id:
+                        found = True
+                        break
+                    queue.append(neighbor)
+        if instrument.enabled:
+            self._count_traversal([i for i, mark in enumerate(stamp) if mark == generation])
+        return found
+
+    def _reached(self, goal):
+        i = self.ids.get(goal)
+        if i is None or self._bfs_buffers is None or self._bfs_buffers[2][i] != self._generation:
+            return None
+        return i
+
+    def _path_to(self, goal):
+        i = self._reached(goal)
+        if i is None:
+            return None
+        parent = self._bfs_buffers[0]
+        path = []
+        while i >= 0:
+            path.append(self.labels[i])
+            i = parent[i]
+        path.reverse()
+        return path
+
+    def _depth_of(self, goal):
+        i = self._reached(goal)
+        return float('inf') if i is None else self._bfs_buffers[1][i]
+
+    def _bfs_distances(self, source):
+        if source not in self.ids:
+            return {source: 0}
+        distance = self._bfs_levels(self.ids[source])
+        reached = np.flatnonzero(distance >= 0)
+        return dict(zip([self.labels[i] for i in reached.tolist()], distance[reached].tolist()))
+
+    def _single_source_dependencies(self, source):
+        n = len(self.labels)
+        s = self.ids[source]
+        order = []
+        predecessors = [[] for _ in range(n)]
+        sigma = [0] * n
+        distance = [-1] * n
+        sigma[s], distance[s] = 1, 0
+        queue = deque([s])
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            for neighbor in self.neighbor_ids(current).tolist():
+                if distance[neighbor] < 0:
+                    distance[neighbor] = distance[current] + 1
+                    queue.append(neighbor)
+                if distance[neighbor] == distance[current] + 1:
+                    sigma[neighbor] += sigma[current]
+                    predecessors[neighbor].append(current)
+        dependency = [0.0] * n
+        for vertex in reversed(order):
+            for pred in predecessors[vertex]:
+                dependency[pred] += sigma[pred] / sigma[vertex] * (1 + dependency[vertex])
+        if instrument.enabled:
+            self._count_traversal(order)
+        return {self.labels[i]: dependency[i] for i in order if i != s}
+
+
+if __name__ == '__main__':
+    connections = [
+        ('1', '2'), ('1', '3'),
+        ('2', '3'),
+        ('3', '4'), ('3', '5'), ('3', '12'),
+        ('4', '5'),
+        ('5', '11'),
+        ('6', '7'), ('6', '12'),
+        ('7', '12'),
+        ('8', '12'),
+        ('9', '12'),
+        ('10', '12'),
+        ('11', '12')
+    ]
+    g = Graph(connections, directed=False)
+
+    #question 1
+    specific_nodes_centrality = g.closeness_centrality(nodes=['3', '12'])
+    print(f"Closeness centrality for nodes 3 and 12: {specific_nodes_centrality}")  #currently wrong
+    #question 2
+    eccentricity_of_vertex_3 = g.eccentricity('3')
+    print(f"Eccentricity of vertex 3: {eccentricity_of_vertex_3}")
+    eccentricity_of_vertex_12 = g.eccentricity('12')
+    print(f"Eccentricity of vertex 12: {eccentricity_of_vertex_12}")
+    eccentricity_of_vertex_11 = g.eccentricity('11')
+    print(f"Eccentricity of vertex 11: {eccentricity_of_vertex_11}")
+    #question 3
+    specific_vertices_centrality = g.betweenness_centrality(['3', '12'], normalized=True)
+    print(f"Betweenness centrality for vertices 3 and 12: {specific_vertices_centrality}")
+    #question 5
+    average_length = g.average_shortest_path_length()
+    print(f"Average shortest path length: {average_length}")
+    #question 6, saved to a file so the script doesn't stop until the window is closed
+    g.plot_degree_distribution('degree_distribution.png')
+    #question 7
+    clustering_coefficient_of_vertex_3 = g.clustering_coefficient('3')
+    print(f"Clustering coefficient of vertex 3: {clustering_coefficient_of_vertex_3}")
+    #question 8
+    average_clustering = g.average_clustering_coefficient()
+    print(f"Average clustering coefficient: {average_clustering}")
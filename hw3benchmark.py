@@ -0,0 +1,177 @@
+"""Time every hw3.Graph metric on synthetic graphs and check it against networkx.
+
+Usage: python hw3benchmark.py --sizes 100,1000,10000 --output results.jsonl
+
+Each (graph, size, metric) run is written as one JSON object per line so
+results from different commits can be appended to the same file and diffed.
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+
+from hw3 import Graph
+
+
+def erdos_renyi(edges, seed=0):
+    """G(n, m) random graph with an average degree of 10"""
+    n = max(edges // 5, 10)
+    rng = random.Random(seed)
+    chosen = set()
+    while len(chosen) < min(edges, n * (n - 1) // 2):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            chosen.add((min(u, v), max(u, v)))
+    return [(str(u), str(v)) for u, v in chosen]
+
+
+def barabasi_albert(edges, seed=0, k=5):
+    """Preferential attachment, each new vertex linking to k existing ones"""
+    rng = random.Random(seed)
+    targets = list(range(k))
+    repeated = []
+    connections = []
+    n = max(edges // k + k, k + 1)
+    for source in range(k, n):
+        connections.extend((str(source), str(t)) for t in set(targets))
+        repeated.extend(targets)
+        repeated.extend([source] * k)
+        targets = [rng.choice(repeated) for _ in range(k)]
+    return connections
+
+
+def grid(edges, seed=0):
+    """Square 2-D lattice with roughly the requested number of edges"""
+    side = max(int(math.sqrt(edges / 2)), 2)
+    connections = []
+    for row in range(side):
+        for col in range(side):
+            if col + 1 < side:
+                connections.append((f'{row},{col}', f'{row},{col + 1}'))
+            if row + 1 < side:
+                connections.append((f'{row},{col}', f'{row + 1},{col}'))
+    return connections
+
+
+def self_loops(edges, seed=0):
+    """erdos_renyi with a self-loop on every tenth vertex"""
+    connections = erdos_renyi(edges, seed)
+    vertices = sorted({v for edge in connections for v in edge})
+    return connections + [(v, v) for v in vertices[::10]]
+
+
+GENERATORS = {'erdos_renyi': erdos_renyi, 'barabasi_albert': barabasi_albert, 'grid': grid,
+              'self_loops': self_loops}
+
+
+def _nx_closeness(G):
+    """networkx closeness rescaled to Graph's 1 / sum(d) over reachable vertices"""
+    import networkx as nx
+    reference = nx.closeness_centrality(G, wf_improved=False)  # (reached - 1) / sum(d)
+    for component in nx.connected_components(G):
+        for v in component:
+            reference[v] = reference[v] / (len(component) - 1) if len(component) > 1 else 0
+    return reference
+
+
+METRICS = {
+    'closeness': lambda g: g.closeness_centrality(),
+    'eccentricity': lambda g: g.eccentricities(),
+    'betweenness': lambda g: g.betweenness_centrality(normalized=True),
+    'average_path_length': lambda g: g.average_shortest_path_length(),
+    'clustering': lambda g: g.average_clustering_coefficient(),
+    'transitivity': lambda g: g.transitivity(),
+}
+
+
+def oracle(metric, G, result):
+    """Return (ours, reference) for metric, or None when networkx has no answer"""
+    import networkx as nx
+    if metric == 'closeness':
+        return result, _nx_closeness(G)
+    if metric == 'betweenness':
+        return result, nx.betweenness_centrality(G, normalized=True)
+    if metric == 'clustering':
+        return result, nx.average_clustering(G)
+    if metric == 'transitivity':
+        return result, nx.transitivity(G)
+    if not nx.is_connected(G):
+        return None  # networkx rejects these on disconnected graphs
+    if metric == 'eccentricity':
+        return result, nx.eccentricity(G)
+    return result, nx.average_shortest_path_length(G)
+
+
+def max_error(ours, reference):
+    if isinstance(reference, dict):
+        return max((abs(ours[v] - r) for v, r in reference.items()), default=0.0)
+    return abs(ours - reference)
+
+
+def run(generators, sizes, metrics, backend='dict', check=True, tolerance=1e-9, seed=0):
+    """Yield one result record per (generator, size, metric)"""
+    for name in generators:
+        for size in sizes:
+            connections = GENERATORS[name](size, seed)
+            vertices = len({v for edge in connections for v in edge})
+            G = None
+            if check:
+                import networkx as nx
+                G = nx.Graph(connections)
+            for metric in metrics:
+                # A fresh graph per metric, so each is timed from a cold start
+                g = Graph(connections)
+                if backend == 'csr':
+                    g = g.freeze()
+                start = time.perf_counter()
+                result = METRICS[metric](g)
+                seconds = time.perf_counter() - start
+                record = {
+                    'graph': name, 'target_edges': size, 'vertices': vertices,
+                    'edges': len(connections), 'backend': backend, 'metric': metric,
+                    'seconds': seconds, 'seed': seed,
+                }
+                compared = oracle(metric, G, result) if check else None
+                if compared is not None:
+                    error = max_error(*compared)
+                    record['max_error'] = error
+                    record['ok'] = error <= tolerance
+                yield record
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--graphs', default=','.join(GENERATORS))
+    parser.add_argument('--sizes', default='100,1000,10000',
+                        help='comma separated target edge counts; the all-pairs metrics '
+                             '(closeness, eccentricity, betweenness, average_path_length) '
+                             'do one BFS per vertex, so past ~100000 edges they take hours')
+    parser.add_argument('--metrics', default=','.join(METRICS))
+    parser.add_argument('--backend', choices=('dict', 'csr'), default='dict')
+    parser.add_argument('--no-check', action='store_true', help='skip the networkx comparison')
+    parser.add_argument('--tolerance', type=float, default=1e-9)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='append JSON lines here instead of stdout')
+    args = parser.parse_args(argv)
+
+    out = open(args.output, 'a') if args.output else sys.stdout
+    failures = 0
+    stamp = {'timestamp': time.time(), 'python': platform.python_version()}
+    try:
+        for record in run(args.graphs.split(','), [int(s) for s in args.sizes.split(',')],
+                          args.metrics.split(','), args.backend, not args.no_check,
+                          args.tolerance, args.seed):
+            record.update(stamp)
+            print(json.dumps(record), file=out, flush=True)
+            failures += record.get('ok') is False
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
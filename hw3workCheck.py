@@ -1,5 +1,7 @@
 import networkx as nx
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # render to files, never open a window
 import matplotlib.pyplot as plt
 
 # Define the connections
@@ -26,7 +28,8 @@ G.add_edges_from(connections)
 # Draw the graph
 plt.figure(figsize=(8, 6))
 nx.draw(G, with_labels=True, node_color='skyblue', node_size=700, edge_color='k', linewidths=1, font_size=15)
-plt.show()
+plt.savefig('hw3_graph.png')
+plt.close()
 
 
 # Calculate the closeness centrality of vertices 3 and 12
@@ -109,4 +112,5 @@ nx.draw_networkx(G, node_color=colors, node_size=node_size, cmap=plt.cm.plasma,
                  with_labels=False, edge_color="grey", alpha=0.7)
 plt.axis('off')
 plt.title("Erdos-Renyi Random Graph Visualization")
-plt.show()
\ No newline at end of file
+plt.savefig('erdos_renyi_graph.png')
+plt.close()
\ No newline at end of file
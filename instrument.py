@@ -0,0 +1,169 @@
+"""Opt-in profiling for the hw1/hw2 statistics routines and hw3.Graph.
+
+Metric entry points wrapped with @timed record their call count, wall time
+and peak traced allocation, and traversal code bumps counters such as
+bfs_runs and edges_scanned. All of it is off by default: a disabled wrapper
+costs one flag check, and counters are only computed when `enabled` is
+true. Scalar kernels called per element (sample_mean, euclidean_distance,
+...) are deliberately left unwrapped so even that check stays out of them.
+
+    with instrument.profile() as prof:
+        g.betweenness_centrality()
+    print(prof.summary())
+    prof.to_json('profile.json')
+"""
+import functools
+import json
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+
+enabled = False
+_calls = {}  # qualified name -> {'calls', 'seconds', 'peak_bytes'}
+_counters = defaultdict(int)
+_stack = []  # [traced bytes at entry, highest peak seen so far] per active call
+_started_tracing = False
+
+
+def enable(trace_memory=True):
+    """Start recording; trace_memory also turns on tracemalloc for peak sizes."""
+    global enabled, _started_tracing
+    enabled = True
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracing = True
+
+
+def disable():
+    """Stop recording (collected numbers are kept until reset())."""
+    global enabled, _started_tracing
+    enabled = False
+    if _started_tracing:
+        tracemalloc.stop()
+        _started_tracing = False
+
+
+def reset():
+    _calls.clear()
+    _counters.clear()
+
+
+def count(name, amount=1):
+    """Add amount to counter name (callers check `enabled` first in hot loops)."""
+    if enabled:
+        _counters[name] += amount
+
+
+def timed(func):
+    """Decorator recording calls, wall time and peak allocation of func."""
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not enabled:
+            return func(*args, **kwargs)
+        return _record(name, func, args, kwargs)
+    return wrapper
+
+
+def _record(name, func, args, kwargs):
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+        if _stack:
+            # Save the caller's peak so far before resetting it for this call
+            _stack[-1][1] = max(_stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        _stack.append([current, current])
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        seconds = time.perf_counter() - start
+        stats = _calls.setdefault(name, {"calls": 0, "seconds": 0.0, "peak_bytes": 0})
+        stats["calls"] += 1
+        stats["seconds"] += seconds
+        if tracing and _stack:
+            entry, nested_peak = _stack.pop()
+            peak = max(nested_peak, tracemalloc.get_traced_memory()[1])
+            stats["peak_bytes"] = max(stats["peak_bytes"], peak - entry)
+            if _stack:
+                _stack[-1][1] = max(_stack[-1][1], peak)
+
+
+def report():
+    """Everything recorded so far as a JSON-serializable dict."""
+    calls = {}
+    for name, stats in sorted(_calls.items(), key=lambda item: -item[1]["seconds"]):
+        calls[name] = dict(stats, mean_seconds=stats["seconds"] / stats["calls"])
+    return {"calls": calls, "counters": dict(_counters)}
+
+
+def summary(data=None):
+    """Plain-text table of a report (the current one by default)."""
+    data = report() if data is None else data
+    lines = [f"{'function':<60} {'calls':>8} {'seconds':>10} {'peak KiB':>10}"]
+    for name, stats in data["calls"].items():
+        lines.append(f"{name:<60} {stats['calls']:>8} {stats['seconds']:>10.4f} "
+                     f"{stats['peak_bytes'] / 1024:>10.1f}")
+    for name, value in sorted(data["counters"].items()):
+        lines.append(f"{name:<60} {value:>8}")
+    return "\n".join(lines)
+
+
+class Profile(object):
+    """Result of a profile() block; filled in when the block exits."""
+
+    def __init__(self):
+        self.report = None
+
+    def summary(self):
+        return summary(self.report)
+
+    def to_json(self, path=None):
+        """Return the report as JSON, also writing it to path if given."""
+        text = json.dumps(self.report, indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+
+def _merge(calls, counters):
+    """Add the numbers of another recording into the current one."""
+    for name, stats in calls.items():
+        total = _calls.setdefault(name, {"calls": 0, "seconds": 0.0, "peak_bytes": 0})
+        total["calls"] += stats["calls"]
+        total["seconds"] += stats["seconds"]
+        total["peak_bytes"] = max(total["peak_bytes"], stats["peak_bytes"])
+    for name, value in counters.items():
+        _counters[name] += value
+
+
+@contextmanager
+def profile(trace_memory=True):
+    """Record everything inside the block into a fresh Profile.
+
+    Numbers recorded before the block are set aside and put back afterwards,
+    with the block's added if recording was already on, and recording and
+    tracemalloc return to the state they were in.
+    """
+    global enabled, _started_tracing
+    result = Profile()
+    was_enabled, started_tracing, was_tracing = enabled, _started_tracing, tracemalloc.is_tracing()
+    saved_calls, saved_counters = dict(_calls), dict(_counters)
+    reset()
+    enable(trace_memory)
+    try:
+        yield result
+    finally:
+        result.report = report()
+        if not was_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        enabled, _started_tracing = was_enabled, started_tracing
+        block_calls, block_counters = dict(_calls), dict(_counters)
+        reset()
+        _merge(saved_calls, saved_counters)
+        if was_enabled:
+            _merge(block_calls, block_counters)